@@ -6,16 +6,96 @@ This module provides the core coordination logic for safe parallel agent executi
 It manages agent registration, file locking, conflict detection, and task coordination.
 """
 
+import atexit
+import fcntl
+import heapq
 import json
 import os
+import re
+import socket
+import socketserver
+import sqlite3
+import sys
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Set
 from dataclasses import dataclass
 from pathlib import Path
 
+# Prefer orjson (fastest), then ujson, then stdlib json for state files
+try:
+    import orjson as _fastjson
+    _JSON_BACKEND = 'orjson'
+except ImportError:
+    try:
+        import ujson as _fastjson
+        _JSON_BACKEND = 'ujson'
+    except ImportError:
+        _fastjson = json
+        _JSON_BACKEND = 'json'
 
-@dataclass
+
+def _json_loads(data: bytes) -> Dict:
+    """Parse JSON bytes using the fastest available backend"""
+    return _fastjson.loads(data)
+
+
+def _json_dumps(data: Dict) -> bytes:
+    """Serialize to indented JSON bytes using the fastest available backend"""
+    if _JSON_BACKEND == 'orjson':
+        return _fastjson.dumps(data, option=_fastjson.OPT_INDENT_2 | _fastjson.OPT_NON_STR_KEYS)
+    return _fastjson.dumps(data, indent=2).encode('utf-8')
+
+
+def _json_dumps_line(data: Dict) -> bytes:
+    """Serialize to compact JSON bytes for one write-ahead log record"""
+    if _JSON_BACKEND == 'orjson':
+        return _fastjson.dumps(data)
+    return _fastjson.dumps(data).encode('utf-8')
+
+
+def _meta_str(value: str) -> str:
+    return value
+
+
+def _meta_duration(value: str) -> int:
+    return int(value.split()[0])
+
+
+def _meta_list(value: str) -> List[str]:
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def _meta_bool(value: str) -> bool:
+    return value.lower() in ['true', 'yes', '1']
+
+
+# Dispatch table mapping task file field labels to (metadata key, converter)
+_METADATA_FIELDS = {
+    '**Assigned Mode**': ('mode', _meta_str),
+    '**Priority**': ('priority', _meta_str),
+    '**Parallel Safety**': ('parallel_safety', _meta_str),
+    '**Classification**': ('classification', _meta_str),
+    '**Estimated Duration**': ('estimated_duration', _meta_duration),
+    '**Conflicts With**': ('conflicts_with', _meta_list),
+    '**Depends On**': ('depends_on', _meta_list),
+    '**Modifies Files**': ('modifies_files', _meta_list),
+    '**Reads Files**': ('reads_files', _meta_list),
+    '**Locked Resources**': ('locked_resources', _meta_list),
+    '**Parallel Compatible**': ('parallel_compatible', _meta_bool),
+}
+
+# Single pattern matching any metadata field line in one pass over the file
+_METADATA_RE = re.compile(
+    r'^[ \t]*(' + '|'.join(re.escape(field) for field in _METADATA_FIELDS) + r'):[ \t]*(.*?)[ \t]*$',
+    re.MULTILINE
+)
+
+
+@dataclass(slots=True)
 class TaskMetadata:
     """Metadata for a task extracted from task file"""
     task_file: str
@@ -30,9 +110,10 @@ class TaskMetadata:
     reads_files: List[str]
     locked_resources: List[str]
     parallel_compatible: bool
+    conflicts_with_set: frozenset = frozenset()
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentStatus:
     """Status of an active agent"""
     agent_id: str
@@ -47,7 +128,7 @@ class AgentStatus:
     heartbeat: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class FileLock:
     """File lock information"""
     file_path: str
@@ -62,19 +143,85 @@ class FileLock:
 
 class CoordinationSystem:
     """Main coordination system class"""
-    
-    def __init__(self, base_path: str = "/mnt/c/dev/gol"):
+
+    # Minimum seconds between write-behind flushes of dirty state
+    FLUSH_INTERVAL = 0.5
+
+    # Compact the write-ahead log into a snapshot once it grows past this
+    LOG_COMPACT_BYTES = 64 * 1024
+
+    # Age after which an agent heartbeat is considered stale
+    STALE_AGENT_SECONDS = 15 * 60
+
+    def __init__(self, base_path: str = "/mnt/c/dev/gol", use_sqlite: Optional[bool] = None):
         self.base_path = Path(base_path)
         self.coordination_path = self.base_path / "meta" / "coordination"
         self.active_agents_file = self.coordination_path / "active-agents.json"
         self.file_locks_file = self.coordination_path / "file-locks.json"
-        
+        self.active_agents_log = self.coordination_path / "active-agents.log"
+        self.file_locks_log = self.coordination_path / "file-locks.log"
+        self.coordination_lock_file = self.coordination_path / "coordination.lock"
+        self.coordination_db_file = self.coordination_path / "coordination.db"
+
+        if use_sqlite is None:
+            use_sqlite = os.environ.get('COORDINATION_SQLITE', '').lower() in ['1', 'true', 'yes']
+        self._db: Optional[sqlite3.Connection] = None
+
         # Ensure coordination directory exists
         self.coordination_path.mkdir(parents=True, exist_ok=True)
-        
+
         # Initialize files if they don't exist
         self._init_coordination_files()
-    
+
+        # Load snapshots once, replay any write-ahead log on top, keep in memory
+        self._agents_data = self._load_json(self.active_agents_file)
+        self._agents_data.setdefault('agents', {})
+        self._locks_data = self._load_json(self.file_locks_file)
+        self._locks_data.setdefault('locks', {})
+        self._agents_dirty = False
+        self._locks_dirty = False
+        self._snapshot_cache: Dict[str, bytes] = {
+            'agents': _json_dumps_line(self._agents_data['agents']),
+            'locks': _json_dumps_line(self._locks_data['locks'])
+        }
+        self._snapshot_stamp: Dict[str, Tuple[int, int]] = {
+            'agents': self._stat_snapshot('agents'),
+            'locks': self._stat_snapshot('locks')
+        }
+        self._task_metadata_cache: Dict[str, Tuple[float, Optional[TaskMetadata]]] = {}
+        self._task_dirs = [
+            self.base_path / impl / "tasks"
+            for impl in ['gol-bevy', 'gol-entt', 'gol-flecs', 'gol-console-client', 'meta']
+        ]
+        self._task_location_cache: Dict[str, Path] = {}
+        self._mode_task_dirs = {
+            'bevy': self.base_path / 'gol-bevy' / 'tasks',
+            'entt': self.base_path / 'gol-entt' / 'tasks',
+            'flecs': self.base_path / 'gol-flecs' / 'tasks',
+            'console': self.base_path / 'gol-console-client' / 'tasks',
+            'meta': self.base_path / 'meta' / 'tasks',
+        }
+        self._log_offset = {'agents': 0, 'locks': 0}
+        if use_sqlite:
+            self._init_sqlite()
+            with self._coordination_lock():
+                self._load_sqlite('agents')
+                self._load_sqlite('locks')
+                self._consume_log_into_db('agents')
+                self._consume_log_into_db('locks')
+        else:
+            with self._coordination_lock():
+                self._replay_log('agents')
+                self._replay_log('locks')
+        self._lock_expiry: List[Tuple[float, str]] = []
+        self._index_lock_expiry()
+        self._agents_by_task: Dict[str, Set[str]] = {}
+        self._index_agents_by_task()
+        self._last_flush = time.monotonic()
+
+        # Guarantee dirty state is persisted on interpreter exit
+        atexit.register(self.flush)
+
     def _init_coordination_files(self):
         """Initialize coordination files with default content"""
         if not self.active_agents_file.exists():
@@ -100,67 +247,385 @@ class CoordinationSystem:
     def _load_json(self, file_path: Path) -> Dict:
         """Load JSON file with error handling"""
         try:
-            with open(file_path, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+            with open(file_path, 'rb') as f:
+                return _json_loads(f.read())
+        except (FileNotFoundError, ValueError) as e:
             print(f"Warning: Error loading {file_path}: {e}")
             return {}
-    
-    def _save_json(self, file_path: Path, data: Dict):
-        """Save JSON file with error handling"""
+
+    def _save_json(self, file_path: Path, data: Dict) -> bool:
+        """Save JSON file atomically via a temp file and os.replace,
+        returning whether the write reached disk"""
         try:
             data["last_updated"] = datetime.now().isoformat()
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=file_path.name + '.')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(_json_dumps(data))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, file_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            return True
         except Exception as e:
             print(f"Error saving {file_path}: {e}")
-    
+            return False
+
+    @staticmethod
+    def _now_pair() -> Tuple[datetime, str]:
+        """Current time captured once per operation as (datetime, iso string)"""
+        now = datetime.now()
+        return now, now.isoformat()
+
+    def _index_lock_expiry(self):
+        """Parse lock expiry times once and build the expiry min-heap"""
+        for file_path, lock in self._locks_data['locks'].items():
+            if '_expires_epoch' not in lock:
+                lock['_expires_epoch'] = datetime.fromisoformat(lock['expires_at']).timestamp()
+            heapq.heappush(self._lock_expiry, (lock['_expires_epoch'], file_path))
+
+    def _index_agents_by_task(self):
+        """Build the task-name-to-agents index and parse heartbeat epochs
+        from loaded agent state"""
+        for agent_id, agent_data in self._agents_data['agents'].items():
+            self._agents_by_task.setdefault(agent_data['current_task'], set()).add(agent_id)
+            if '_heartbeat_epoch' not in agent_data:
+                agent_data['_heartbeat_epoch'] = datetime.fromisoformat(agent_data['heartbeat']).timestamp()
+
+    def _persistable_state(self, kind: str) -> Dict:
+        """Copy of a state kind with in-memory-only fields stripped"""
+        data = dict(self._agents_data if kind == 'agents' else self._locks_data)
+        data[kind] = {
+            key: {k: v for k, v in record.items() if not k.startswith('_')}
+            for key, record in self._state_dict(kind).items()
+        }
+        return data
+
+    @contextmanager
+    def _coordination_lock(self):
+        """Exclusive advisory flock serializing log and snapshot writes
+        across concurrently running coordination processes"""
+        with open(self.coordination_lock_file, 'a+b') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _state_dict(self, kind: str) -> Dict:
+        """Records dict for a state kind ('agents' or 'locks')"""
+        if kind == 'agents':
+            return self._agents_data['agents']
+        return self._locks_data['locks']
+
+    def _init_sqlite(self):
+        """Open the SQLite journal in WAL mode and create tables"""
+        self._db = sqlite3.connect(str(self.coordination_db_file))
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS agents (key TEXT PRIMARY KEY, record TEXT NOT NULL)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS locks (key TEXT PRIMARY KEY, record TEXT NOT NULL)")
+        self._db.commit()
+
+    def _load_sqlite(self, kind: str):
+        """Load state from the SQLite journal, seeding it from the snapshot
+        on first use"""
+        records = self._state_dict(kind)
+        rows = self._db.execute(f"SELECT key, record FROM {kind}").fetchall()
+        if rows:
+            records.clear()
+            for key, record in rows:
+                records[key] = _json_loads(record)
+            # Snapshot may be behind the journal; refresh it on next flush
+            self._mark_dirty(kind)
+        elif records:
+            self._db.executemany(
+                f"INSERT INTO {kind} (key, record) VALUES (?, ?)",
+                [(key, _json_dumps_line(record).decode('utf-8')) for key, record in records.items()]
+            )
+            self._db.commit()
+
+    def _consume_log_into_db(self, kind: str):
+        """Fold write-ahead log entries left by default-mode runs into the
+        SQLite journal and truncate the log
+
+        Without this, entries journaled but not yet flushed by a prior
+        default-mode run would be silently dropped, and stale logs would
+        later be replayed over a newer snapshot by a default-mode run."""
+        log_path = self._log_file(kind)
+        if not log_path.exists() or log_path.stat().st_size == 0:
+            return
+        self._replay_log(kind)
+        rows = [
+            (key, _json_dumps_line({k: v for k, v in record.items() if not k.startswith('_')}).decode('utf-8'))
+            for key, record in self._state_dict(kind).items()
+        ]
+        self._db.execute(f"DELETE FROM {kind}")
+        self._db.executemany(f"INSERT INTO {kind} (key, record) VALUES (?, ?)", rows)
+        self._db.commit()
+        self._truncate_log(kind)
+
+    def _log_file(self, kind: str) -> Path:
+        """Write-ahead log path for a state kind"""
+        if kind == 'agents':
+            return self.active_agents_log
+        return self.file_locks_log
+
+    def _snapshot_file(self, kind: str) -> Path:
+        """Snapshot path for a state kind"""
+        if kind == 'agents':
+            return self.active_agents_file
+        return self.file_locks_file
+
+    def _stat_snapshot(self, kind: str) -> Tuple[int, int]:
+        """Identity stamp (mtime, size) of a snapshot file, used to detect
+        rewrites by external tools such as the jq-based shell scripts"""
+        try:
+            st = self._snapshot_file(kind).stat()
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return (0, 0)
+
+    @staticmethod
+    def _apply_op(records: Dict, line: bytes):
+        """Apply one journaled set/delete line to a records dict"""
+        line = line.strip()
+        if not line:
+            return
+        op = _json_loads(line)
+        if op['op'] == 'set':
+            records[op['key']] = op['record']
+        elif op['op'] == 'delete':
+            records.pop(op['key'], None)
+
+    def _replay_log(self, kind: str):
+        """Replay write-ahead log records on top of the loaded snapshot"""
+        log_path = self._log_file(kind)
+        if not log_path.exists() or log_path.stat().st_size == 0:
+            return
+
+        records = self._state_dict(kind)
+        try:
+            with open(log_path, 'rb') as f:
+                for line in f:
+                    self._apply_op(records, line)
+                self._log_offset[kind] = f.tell()
+        except (ValueError, KeyError) as e:
+            print(f"Warning: Error replaying {log_path}: {e}")
+
+        # Snapshot is behind the log; compact it on the next flush
+        self._mark_dirty(kind)
+
+    def _resync(self):
+        """Merge state committed by other coordination processes into
+        memory before acting on it"""
+        if self._db is not None:
+            changed = self._resync_sqlite_kind('agents')
+            changed = self._resync_sqlite_kind('locks') or changed
+        else:
+            with self._coordination_lock():
+                changed = self._resync_kind_locked('agents')
+                changed = self._resync_kind_locked('locks') or changed
+        if changed:
+            self._rebuild_indexes()
+
+    def _resync_sqlite_kind(self, kind: str) -> bool:
+        """Reload one state kind from the SQLite journal when other
+        processes have committed changes to it"""
+        rows = self._db.execute(f"SELECT key, record FROM {kind}").fetchall()
+        fresh = {key: _json_loads(record) for key, record in rows}
+        records = self._state_dict(kind)
+        current = {
+            key: {k: v for k, v in record.items() if not k.startswith('_')}
+            for key, record in records.items()
+        }
+        if fresh == current:
+            return False
+        records.clear()
+        records.update(fresh)
+        self._mark_dirty(kind)
+        return True
+
+    def _resync_kind_locked(self, kind: str) -> bool:
+        """Catch one state kind up with its on-disk log; the caller must
+        hold the coordination lock"""
+        log_path = self._log_file(kind)
+        try:
+            log_size = log_path.stat().st_size
+        except OSError:
+            log_size = 0
+        offset = self._log_offset[kind]
+        stamp = self._stat_snapshot(kind)
+        if log_size == offset and stamp == self._snapshot_stamp[kind]:
+            return False
+
+        if log_size < offset or stamp != self._snapshot_stamp[kind]:
+            # The log was compacted into the snapshot by another process,
+            # or the snapshot itself was rewritten in place (the jq-based
+            # shell scripts edit it directly); rebase on the disk snapshot
+            # and replay the whole log on top of it
+            data = self._load_json(self._snapshot_file(kind))
+            data.setdefault(kind, {})
+            if kind == 'agents':
+                self._agents_data = data
+            else:
+                self._locks_data = data
+            self._snapshot_cache[kind] = _json_dumps_line(data[kind])
+            self._snapshot_stamp[kind] = self._stat_snapshot(kind)
+            offset = 0
+
+        if log_size > offset:
+            records = self._state_dict(kind)
+            try:
+                with open(log_path, 'rb') as f:
+                    f.seek(offset)
+                    for line in f:
+                        self._apply_op(records, line)
+                    offset = f.tell()
+                self._mark_dirty(kind)
+            except (ValueError, KeyError) as e:
+                print(f"Warning: Error replaying {log_path}: {e}")
+        self._log_offset[kind] = offset
+        return True
+
+    def _rebuild_indexes(self):
+        """Rebuild derived in-memory indexes after merging foreign state"""
+        self._lock_expiry = []
+        self._index_lock_expiry()
+        self._agents_by_task = {}
+        self._index_agents_by_task()
+
+    def _append_op(self, kind: str, op: Dict):
+        """Append one operation record to the write-ahead log"""
+        log_path = self._log_file(kind)
+        try:
+            with self._coordination_lock():
+                with open(log_path, 'ab') as f:
+                    f.write(_json_dumps_line(op) + b'\n')
+                log_size = log_path.stat().st_size
+            if log_size > self.LOG_COMPACT_BYTES:
+                self.flush()
+        except Exception as e:
+            print(f"Error appending to {log_path}: {e}")
+
+    def _log_set(self, kind: str, key: str):
+        """Journal the current record for a key and mark state dirty"""
+        record = self._state_dict(kind)[key]
+        public = {k: v for k, v in record.items() if not k.startswith('_')}
+        if self._db is not None:
+            self._db.execute(
+                f"INSERT OR REPLACE INTO {kind} (key, record) VALUES (?, ?)",
+                (key, _json_dumps_line(public).decode('utf-8'))
+            )
+            self._db.commit()
+        else:
+            self._append_op(kind, {'op': 'set', 'key': key, 'record': public})
+        self._mark_dirty(kind)
+
+    def _log_delete(self, kind: str, key: str):
+        """Journal removal of a key and mark state dirty"""
+        if self._db is not None:
+            self._db.execute(f"DELETE FROM {kind} WHERE key = ?", (key,))
+            self._db.commit()
+        else:
+            self._append_op(kind, {'op': 'delete', 'key': key})
+        self._mark_dirty(kind)
+
+    def _mark_dirty(self, state: str):
+        """Mark in-memory state as needing a write-back"""
+        if state == 'agents':
+            self._agents_dirty = True
+        elif state == 'locks':
+            self._locks_dirty = True
+
+    def _maybe_flush(self):
+        """Flush dirty state if the debounce window has elapsed"""
+        if not (self._agents_dirty or self._locks_dirty):
+            return
+        if time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        """Snapshot dirty state to disk and truncate the compacted logs
+
+        Operations journaled by other processes are merged into memory
+        under the lock first, so compaction never discards their writes."""
+        if self._agents_dirty or self._locks_dirty:
+            changed = False
+            with self._coordination_lock():
+                if self._db is None:
+                    changed = self._resync_kind_locked('agents')
+                    changed = self._resync_kind_locked('locks') or changed
+                if self._agents_dirty and self._write_snapshot('agents', self.active_agents_file):
+                    self._agents_dirty = False
+                if self._locks_dirty and self._write_snapshot('locks', self.file_locks_file):
+                    self._locks_dirty = False
+            if changed:
+                self._rebuild_indexes()
+        self._last_flush = time.monotonic()
+
+    def _write_snapshot(self, kind: str, file_path: Path) -> bool:
+        """Persist one state kind, skipping the write if nothing changed
+
+        Returns False when the snapshot did not reach disk, in which case
+        the log must not be truncated: it is still the only durable copy."""
+        data = self._persistable_state(kind)
+        encoded = _json_dumps_line(data[kind])
+        if encoded != self._snapshot_cache.get(kind):
+            if not self._save_json(file_path, data):
+                return False
+            self._snapshot_cache[kind] = encoded
+            self._snapshot_stamp[kind] = self._stat_snapshot(kind)
+        if self._db is None:
+            self._truncate_log(kind)
+        return True
+
+    def _truncate_log(self, kind: str):
+        """Truncate a write-ahead log after its snapshot has been written"""
+        log_path = self._log_file(kind)
+        try:
+            if log_path.exists():
+                with open(log_path, 'wb'):
+                    pass
+            self._log_offset[kind] = 0
+        except Exception as e:
+            print(f"Error truncating {log_path}: {e}")
+
     def parse_task_metadata(self, task_file: str) -> Optional[TaskMetadata]:
-        """Parse coordination metadata from task file"""
+        """Parse coordination metadata from task file, cached by mtime"""
         task_path = Path(task_file)
-        if not task_path.exists():
+        try:
+            mtime = task_path.stat().st_mtime
+        except OSError:
+            self._task_metadata_cache.pop(task_file, None)
             return None
-        
+
+        return self._cached_metadata(task_file, mtime)
+
+    def _cached_metadata(self, task_file: str, mtime: float) -> Optional[TaskMetadata]:
+        """Metadata for a task file with a known mtime, parsing on cache miss"""
+        cached = self._task_metadata_cache.get(task_file)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        task_metadata = self._parse_task_metadata(Path(task_file), task_file)
+        self._task_metadata_cache[task_file] = (mtime, task_metadata)
+        return task_metadata
+
+    def _parse_task_metadata(self, task_path: Path, task_file: str) -> Optional[TaskMetadata]:
+        """Parse coordination metadata from task file contents"""
         try:
             with open(task_path, 'r') as f:
                 content = f.read()
             
-            # Extract metadata using simple parsing
+            # Extract metadata in a single regex pass over the content
             metadata = {}
-            lines = content.split('\n')
-            
-            for line in lines:
-                line = line.strip()
-                if line.startswith('**Assigned Mode**:'):
-                    metadata['mode'] = line.split(':', 1)[1].strip()
-                elif line.startswith('**Priority**:'):
-                    metadata['priority'] = line.split(':', 1)[1].strip()
-                elif line.startswith('**Parallel Safety**:'):
-                    metadata['parallel_safety'] = line.split(':', 1)[1].strip()
-                elif line.startswith('**Classification**:'):
-                    metadata['classification'] = line.split(':', 1)[1].strip()
-                elif line.startswith('**Estimated Duration**:'):
-                    duration_str = line.split(':', 1)[1].strip()
-                    metadata['estimated_duration'] = int(duration_str.split()[0])
-                elif line.startswith('**Conflicts With**:'):
-                    conflicts = line.split(':', 1)[1].strip()
-                    metadata['conflicts_with'] = [c.strip() for c in conflicts.split(',') if c.strip()]
-                elif line.startswith('**Depends On**:'):
-                    depends = line.split(':', 1)[1].strip()
-                    metadata['depends_on'] = [d.strip() for d in depends.split(',') if d.strip()]
-                elif line.startswith('**Modifies Files**:'):
-                    modifies = line.split(':', 1)[1].strip()
-                    metadata['modifies_files'] = [f.strip() for f in modifies.split(',') if f.strip()]
-                elif line.startswith('**Reads Files**:'):
-                    reads = line.split(':', 1)[1].strip()
-                    metadata['reads_files'] = [f.strip() for f in reads.split(',') if f.strip()]
-                elif line.startswith('**Locked Resources**:'):
-                    locked = line.split(':', 1)[1].strip()
-                    metadata['locked_resources'] = [r.strip() for r in locked.split(',') if r.strip()]
-                elif line.startswith('**Parallel Compatible**:'):
-                    compatible = line.split(':', 1)[1].strip().lower()
-                    metadata['parallel_compatible'] = compatible in ['true', 'yes', '1']
-            
+            for match in _METADATA_RE.finditer(content):
+                key, convert = _METADATA_FIELDS[match.group(1)]
+                metadata[key] = convert(match.group(2))
+
             return TaskMetadata(
                 task_file=task_file,
                 mode=metadata.get('mode', 'unknown'),
@@ -173,7 +638,8 @@ class CoordinationSystem:
                 modifies_files=metadata.get('modifies_files', []),
                 reads_files=metadata.get('reads_files', []),
                 locked_resources=metadata.get('locked_resources', []),
-                parallel_compatible=metadata.get('parallel_compatible', False)
+                parallel_compatible=metadata.get('parallel_compatible', False),
+                conflicts_with_set=frozenset(metadata.get('conflicts_with', []))
             )
         
         except Exception as e:
@@ -182,8 +648,8 @@ class CoordinationSystem:
     
     def register_agent(self, agent_id: str, mode: str, task_path: str) -> bool:
         """Register an agent with the coordination system"""
-        agents_data = self._load_json(self.active_agents_file)
-        
+        self._resync()
+
         # Parse task metadata
         task_metadata = self.parse_task_metadata(task_path)
         if not task_metadata:
@@ -191,66 +657,99 @@ class CoordinationSystem:
             return False
         
         # Check for conflicts before registration
-        conflicts = self.check_task_conflicts(task_metadata)
+        conflicts = self.check_task_conflicts(task_metadata, detailed=True)
         if conflicts:
             print(f"Cannot register agent {agent_id}: conflicts detected: {conflicts}")
             return False
         
         # Calculate estimated completion
-        estimated_completion = datetime.now() + timedelta(minutes=task_metadata.estimated_duration)
-        
+        now, now_iso = self._now_pair()
+        estimated_completion = now + timedelta(minutes=task_metadata.estimated_duration)
+
         # Register agent
-        agents_data['agents'][agent_id] = {
+        self._agents_data['agents'][agent_id] = {
             'mode': mode,
             'current_task': os.path.basename(task_path),
             'task_path': task_path,
             'status': 'starting',
-            'started_at': datetime.now().isoformat(),
+            'started_at': now_iso,
             'estimated_completion': estimated_completion.isoformat(),
             'locked_files': [],
             'parallel_compatible': task_metadata.parallel_compatible,
-            'heartbeat': datetime.now().isoformat()
+            'heartbeat': now_iso,
+            '_heartbeat_epoch': now.timestamp()
         }
         
-        self._save_json(self.active_agents_file, agents_data)
-        
+        self._log_set('agents', agent_id)
+        self._agents_by_task.setdefault(os.path.basename(task_path), set()).add(agent_id)
+
         # Acquire file locks
-        for file_path in task_metadata.modifies_files:
-            self.acquire_file_lock(agent_id, file_path, 'write')
-        
+        self.acquire_file_locks(agent_id, task_metadata.modifies_files, 'write')
+
+        self._maybe_flush()
         return True
     
     def unregister_agent(self, agent_id: str) -> bool:
         """Unregister an agent from the coordination system"""
-        agents_data = self._load_json(self.active_agents_file)
-        
-        if agent_id not in agents_data.get('agents', {}):
+        self._resync()
+        if agent_id not in self._agents_data['agents']:
             return False
-        
+
         # Release all file locks
-        agent_data = agents_data['agents'][agent_id]
-        for file_path in agent_data.get('locked_files', []):
+        agent_data = self._agents_data['agents'][agent_id]
+        for file_path in list(agent_data.get('locked_files', [])):
             self.release_file_lock(agent_id, file_path)
-        
+
         # Remove agent
-        del agents_data['agents'][agent_id]
-        self._save_json(self.active_agents_file, agents_data)
-        
+        current_task = agent_data['current_task']
+        del self._agents_data['agents'][agent_id]
+        self._log_delete('agents', agent_id)
+        task_agents = self._agents_by_task.get(current_task)
+        if task_agents:
+            task_agents.discard(agent_id)
+            if not task_agents:
+                del self._agents_by_task[current_task]
+        self._maybe_flush()
+
         return True
     
     def acquire_file_lock(self, agent_id: str, file_path: str, lock_type: str = 'write') -> bool:
         """Acquire a file lock for an agent"""
-        locks_data = self._load_json(self.file_locks_file)
-        
+        return bool(self.acquire_file_locks(agent_id, [file_path], lock_type))
+
+    def acquire_file_locks(self, agent_id: str, file_paths: List[str], lock_type: str = 'write') -> List[str]:
+        """Acquire locks on several files with one agent state update,
+        returning the paths that were actually acquired"""
+        self._resync()
+        now, now_iso = self._now_pair()
+        acquired = [
+            file_path for file_path in file_paths
+            if self._acquire_lock_record(agent_id, file_path, lock_type, now, now_iso)
+        ]
+
+        # Update agent's locked files once for the whole batch
+        if acquired and agent_id in self._agents_data['agents']:
+            locked_files = self._agents_data['agents'][agent_id]['locked_files']
+            added = [f for f in acquired if f not in locked_files]
+            if added:
+                locked_files.extend(added)
+                self._log_set('agents', agent_id)
+
+        self._maybe_flush()
+        return acquired
+
+    def _acquire_lock_record(self, agent_id: str, file_path: str, lock_type: str,
+                             now: datetime, now_iso: str) -> bool:
+        """Create or refuse a single lock record in the locks table"""
         # Check for conflicting locks
-        if file_path in locks_data.get('locks', {}):
-            existing_lock = locks_data['locks'][file_path]
-            
+        if file_path in self._locks_data['locks']:
+            existing_lock = self._locks_data['locks'][file_path]
+
             # Check if lock is expired
-            expires_at = datetime.fromisoformat(existing_lock['expires_at'])
-            if datetime.now() > expires_at:
+            if now.timestamp() > existing_lock['_expires_epoch']:
                 # Remove expired lock
-                del locks_data['locks'][file_path]
+                del self._locks_data['locks'][file_path]
+                self._log_delete('locks', file_path)
             else:
                 # Check compatibility
                 if existing_lock['lock_type'] == 'read' and lock_type == 'read':
@@ -259,75 +758,74 @@ class CoordinationSystem:
                 else:
                     # Write locks are exclusive
                     return False
-        
+
         # Acquire lock
-        expires_at = datetime.now() + timedelta(minutes=60)
-        locks_data['locks'][file_path] = {
+        expires_at = now + timedelta(minutes=60)
+        expires_epoch = expires_at.timestamp()
+        self._locks_data['locks'][file_path] = {
             'locked_by': agent_id,
             'lock_type': lock_type,
-            'acquired_at': datetime.now().isoformat(),
+            'acquired_at': now_iso,
             'expires_at': expires_at.isoformat(),
-            'purpose': 'task_execution'
+            'purpose': 'task_execution',
+            '_expires_epoch': expires_epoch
         }
-        
-        self._save_json(self.file_locks_file, locks_data)
-        
-        # Update agent's locked files
-        agents_data = self._load_json(self.active_agents_file)
-        if agent_id in agents_data.get('agents', {}):
-            if file_path not in agents_data['agents'][agent_id]['locked_files']:
-                agents_data['agents'][agent_id]['locked_files'].append(file_path)
-                self._save_json(self.active_agents_file, agents_data)
-        
+        heapq.heappush(self._lock_expiry, (expires_epoch, file_path))
+        self._log_set('locks', file_path)
         return True
     
     def release_file_lock(self, agent_id: str, file_path: str) -> bool:
         """Release a file lock"""
-        locks_data = self._load_json(self.file_locks_file)
-        
-        if file_path in locks_data.get('locks', {}):
-            lock = locks_data['locks'][file_path]
+        self._resync()
+        if file_path in self._locks_data['locks']:
+            lock = self._locks_data['locks'][file_path]
             if lock['locked_by'] == agent_id:
-                del locks_data['locks'][file_path]
-                self._save_json(self.file_locks_file, locks_data)
-                
+                del self._locks_data['locks'][file_path]
+                self._log_delete('locks', file_path)
+
                 # Update agent's locked files
-                agents_data = self._load_json(self.active_agents_file)
-                if agent_id in agents_data.get('agents', {}):
-                    locked_files = agents_data['agents'][agent_id]['locked_files']
+                if agent_id in self._agents_data['agents']:
+                    locked_files = self._agents_data['agents'][agent_id]['locked_files']
                     if file_path in locked_files:
                         locked_files.remove(file_path)
-                        self._save_json(self.active_agents_file, agents_data)
-                
+                        self._log_set('agents', agent_id)
+
+                self._maybe_flush()
                 return True
-        
+
         return False
     
-    def check_task_conflicts(self, task_metadata: TaskMetadata) -> List[str]:
-        """Check for conflicts with a proposed task"""
+    def check_task_conflicts(self, task_metadata: TaskMetadata, detailed: bool = False) -> List[str]:
+        """Check for conflicts with a proposed task
+
+        Returns on the first conflict found unless detailed is set, in
+        which case every conflict is collected for reporting."""
         conflicts = []
-        
+
         # Check file conflicts
-        locks_data = self._load_json(self.file_locks_file)
+        now_epoch = time.time()
         for file_path in task_metadata.modifies_files:
-            if file_path in locks_data.get('locks', {}):
-                lock = locks_data['locks'][file_path]
-                expires_at = datetime.fromisoformat(lock['expires_at'])
-                if datetime.now() <= expires_at:
+            if file_path in self._locks_data['locks']:
+                lock = self._locks_data['locks'][file_path]
+                if now_epoch <= lock['_expires_epoch']:
                     conflicts.append(f"File locked: {file_path} by {lock['locked_by']}")
-        
+                    if not detailed:
+                        return conflicts
+
         # Check task dependencies
         for dependency in task_metadata.depends_on:
             if not self.is_task_complete(dependency):
                 conflicts.append(f"Dependency not complete: {dependency}")
-        
-        # Check explicit conflicts
-        agents_data = self._load_json(self.active_agents_file)
-        for agent_id, agent_data in agents_data.get('agents', {}).items():
-            current_task = agent_data['current_task']
-            if current_task in task_metadata.conflicts_with:
-                conflicts.append(f"Conflicting task active: {current_task}")
-        
+                if not detailed:
+                    return conflicts
+
+        # Check explicit conflicts by intersecting the precomputed conflict
+        # set with the active task-name index
+        for conflict_task in task_metadata.conflicts_with_set & self._agents_by_task.keys():
+            conflicts.append(f"Conflicting task active: {conflict_task}")
+            if not detailed:
+                return conflicts
+
         return conflicts
     
     def is_task_complete(self, task_file: str) -> bool:
@@ -335,88 +833,119 @@ class CoordinationSystem:
         # For now, assume task is complete if the file doesn't exist
         # This is a simplified implementation
         task_path = Path(task_file)
-        if not task_path.is_absolute():
-            # Try to find the task file in the project
-            for impl in ['gol-bevy', 'gol-entt', 'gol-flecs', 'gol-console-client', 'meta']:
-                potential_path = self.base_path / impl / "tasks" / task_file
-                if potential_path.exists():
-                    return False
-        else:
+        if task_path.is_absolute():
             return not task_path.exists()
-        
+
+        # Reuse the previously resolved location instead of re-scanning
+        cached = self._task_location_cache.get(task_file)
+        if cached is not None:
+            if cached.exists():
+                return False
+            del self._task_location_cache[task_file]
+            return True
+
+        # Try to find the task file in the project
+        for tasks_dir in self._task_dirs:
+            potential_path = tasks_dir / task_file
+            if potential_path.exists():
+                self._task_location_cache[task_file] = potential_path
+                return False
+
         return True
     
     def get_compatible_tasks(self, agent_mode: str) -> List[str]:
         """Get tasks that are compatible with parallel execution"""
+        self._resync()
         compatible_tasks = []
         
         # Find all tasks for the agent mode
-        mode_path = self.base_path / f"gol-{agent_mode}" / "tasks"
-        if agent_mode == "meta":
-            mode_path = self.base_path / "meta" / "tasks"
-        elif agent_mode == "console":
-            mode_path = self.base_path / "gol-console-client" / "tasks"
-        
-        if not mode_path.exists():
+        mode_path = self._mode_task_dirs.get(agent_mode)
+        if mode_path is None:
+            mode_path = self.base_path / f"gol-{agent_mode}" / "tasks"
+
+        try:
+            entries = os.scandir(mode_path)
+        except FileNotFoundError:
             return compatible_tasks
-        
-        for task_file in mode_path.glob("*.md"):
-            task_metadata = self.parse_task_metadata(str(task_file))
+
+        with entries:
+            task_files = [
+                (entry.path, entry.stat().st_mtime)
+                for entry in entries
+                if entry.name.endswith('.md') and entry.is_file()
+            ]
+
+        if not task_files:
+            return compatible_tasks
+
+        # Parse task files concurrently; conflict checks stay sequential
+        # because they read shared coordination state
+        with ThreadPoolExecutor(max_workers=min(8, len(task_files))) as pool:
+            parsed = pool.map(lambda item: self._cached_metadata(*item), task_files)
+
+        for (task_path, _), task_metadata in zip(task_files, parsed):
             if task_metadata and task_metadata.parallel_compatible:
                 conflicts = self.check_task_conflicts(task_metadata)
                 if not conflicts:
-                    compatible_tasks.append(str(task_file))
-        
+                    compatible_tasks.append(task_path)
+
         return compatible_tasks
     
     def update_agent_status(self, agent_id: str, status: str) -> bool:
         """Update agent status"""
-        agents_data = self._load_json(self.active_agents_file)
-        
-        if agent_id in agents_data.get('agents', {}):
-            agents_data['agents'][agent_id]['status'] = status
-            agents_data['agents'][agent_id]['heartbeat'] = datetime.now().isoformat()
-            self._save_json(self.active_agents_file, agents_data)
+        self._resync()
+        if agent_id in self._agents_data['agents']:
+            now, now_iso = self._now_pair()
+            self._agents_data['agents'][agent_id]['status'] = status
+            self._agents_data['agents'][agent_id]['heartbeat'] = now_iso
+            self._agents_data['agents'][agent_id]['_heartbeat_epoch'] = now.timestamp()
+            self._log_set('agents', agent_id)
+            self._maybe_flush()
             return True
-        
+
         return False
-    
+
     def update_heartbeat(self, agent_id: str) -> bool:
         """Update agent heartbeat"""
-        agents_data = self._load_json(self.active_agents_file)
-        
-        if agent_id in agents_data.get('agents', {}):
-            agents_data['agents'][agent_id]['heartbeat'] = datetime.now().isoformat()
-            self._save_json(self.active_agents_file, agents_data)
+        self._resync()
+        if agent_id in self._agents_data['agents']:
+            now, now_iso = self._now_pair()
+            self._agents_data['agents'][agent_id]['heartbeat'] = now_iso
+            self._agents_data['agents'][agent_id]['_heartbeat_epoch'] = now.timestamp()
+            self._log_set('agents', agent_id)
+            self._maybe_flush()
             return True
-        
+
         return False
-    
+
     def cleanup_expired_locks(self):
-        """Clean up expired file locks"""
-        locks_data = self._load_json(self.file_locks_file)
-        expired_locks = []
-        
-        for file_path, lock in locks_data.get('locks', {}).items():
-            expires_at = datetime.fromisoformat(lock['expires_at'])
-            if datetime.now() > expires_at:
-                expired_locks.append(file_path)
-        
-        for file_path in expired_locks:
-            del locks_data['locks'][file_path]
+        """Clean up expired file locks by popping the expiry heap"""
+        self._resync()
+        now = time.time()
+        expired = False
+
+        while self._lock_expiry and self._lock_expiry[0][0] <= now:
+            expires_epoch, file_path = heapq.heappop(self._lock_expiry)
+            lock = self._locks_data['locks'].get(file_path)
+            # Skip stale heap entries for locks already released or re-acquired
+            if lock is None or lock['_expires_epoch'] != expires_epoch:
+                continue
+            del self._locks_data['locks'][file_path]
+            self._log_delete('locks', file_path)
             print(f"Cleaned up expired lock: {file_path}")
-        
-        if expired_locks:
-            self._save_json(self.file_locks_file, locks_data)
-    
+            expired = True
+
+        if expired:
+            self._maybe_flush()
+
     def cleanup_stale_agents(self):
         """Clean up agents with stale heartbeats"""
-        agents_data = self._load_json(self.active_agents_file)
+        self._resync()
         stale_agents = []
-        
-        for agent_id, agent_data in agents_data.get('agents', {}).items():
-            heartbeat = datetime.fromisoformat(agent_data['heartbeat'])
-            if datetime.now() - heartbeat > timedelta(minutes=15):
+
+        now_epoch = time.time()
+        for agent_id, agent_data in self._agents_data['agents'].items():
+            if now_epoch - agent_data['_heartbeat_epoch'] > self.STALE_AGENT_SECONDS:
                 stale_agents.append(agent_id)
         
         for agent_id in stale_agents:
@@ -427,26 +956,149 @@ class CoordinationSystem:
         """Get comprehensive status report"""
         self.cleanup_expired_locks()
         self.cleanup_stale_agents()
-        
-        agents_data = self._load_json(self.active_agents_file)
-        locks_data = self._load_json(self.file_locks_file)
-        
+        self.flush()
+
         return {
-            'active_agents': len(agents_data.get('agents', {})),
-            'active_locks': len(locks_data.get('locks', {})),
-            'agents': agents_data.get('agents', {}),
-            'locks': locks_data.get('locks', {}),
-            'coordination_enabled': agents_data.get('coordination_enabled', True)
+            'active_agents': len(self._agents_data['agents']),
+            'active_locks': len(self._locks_data['locks']),
+            'agents': self._persistable_state('agents')['agents'],
+            'locks': self._persistable_state('locks')['locks'],
+            'coordination_enabled': self._agents_data.get('coordination_enabled', True)
         }
 
 
+# Methods callable over the Unix-socket RPC interface
+RPC_METHODS = frozenset({
+    'register_agent',
+    'unregister_agent',
+    'acquire_file_lock',
+    'acquire_file_locks',
+    'release_file_lock',
+    'update_agent_status',
+    'update_heartbeat',
+    'is_task_complete',
+    'get_compatible_tasks',
+    'cleanup_expired_locks',
+    'cleanup_stale_agents',
+    'get_status_report',
+    'flush',
+})
+
+
+class CoordinationServer:
+    """Long-lived coordination service exposing CoordinationSystem over a
+    Unix domain socket
+
+    Running one resident process amortizes the startup state load and the
+    task metadata cache across every shell invocation, instead of paying
+    them per command. Requests are newline-delimited JSON objects of the
+    form {"method": ..., "args": [...], "kwargs": {...}}; responses are
+    {"ok": true, "result": ...} or {"ok": false, "error": ...}. Requests
+    are handled serially, which also serializes access to the shared
+    in-memory state."""
+
+    def __init__(self, base_path: str = "/mnt/c/dev/gol"):
+        self.coord = CoordinationSystem(base_path)
+        self.socket_path = self.coord.coordination_path / "coordination.sock"
+
+    def handle_request(self, request: Dict) -> Dict:
+        """Dispatch one decoded RPC request to the coordination system"""
+        method = request.get('method')
+        if method not in RPC_METHODS:
+            return {'ok': False, 'error': f"Unknown method: {method}"}
+        try:
+            result = getattr(self.coord, method)(*request.get('args', []), **request.get('kwargs', {}))
+            return {'ok': True, 'result': result}
+        except Exception as e:
+            return {'ok': False, 'error': str(e)}
+
+    def serve_forever(self):
+        """Bind the socket and serve requests until interrupted"""
+        server_self = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        request = _json_loads(line)
+                    except ValueError as e:
+                        response = {'ok': False, 'error': f"Invalid request: {e}"}
+                    else:
+                        response = server_self.handle_request(request)
+                    self.wfile.write(_json_dumps_line(response) + b'\n')
+
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+        with socketserver.UnixStreamServer(str(self.socket_path), Handler) as server:
+            print(f"Coordination service listening on {self.socket_path}")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                self.coord.flush()
+                if self.socket_path.exists():
+                    self.socket_path.unlink()
+
+
+def coordination_request(socket_path: str, method: str, *args, **kwargs):
+    """Send one RPC request to a running coordination service"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(socket_path))
+        sock.sendall(_json_dumps_line({'method': method, 'args': list(args), 'kwargs': kwargs}) + b'\n')
+        buffer = b''
+        while not buffer.endswith(b'\n'):
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            buffer += chunk
+
+    response = _json_loads(buffer)
+    if not response['ok']:
+        raise RuntimeError(response['error'])
+    return response['result']
+
+
+def _cli_value(raw: str):
+    """Parse a CLI argument as JSON, falling back to a plain string"""
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return raw
+
+
 def main():
-    """Main function for testing coordination system"""
-    coord = CoordinationSystem()
-    
-    # Example usage
+    """Run the coordination service, call into it, or print status"""
+    base_path = os.environ.get('COORDINATION_BASE_PATH', "/mnt/c/dev/gol")
+    socket_path = Path(base_path) / "meta" / "coordination" / "coordination.sock"
+
+    if len(sys.argv) > 1 and sys.argv[1] == 'serve':
+        CoordinationServer(base_path).serve_forever()
+        return
+
+    if len(sys.argv) > 2 and sys.argv[1] == 'call':
+        args = [_cli_value(raw) for raw in sys.argv[3:]]
+        result = coordination_request(socket_path, sys.argv[2], *args)
+        print(json.dumps(result, indent=2))
+        return
+
+    # Prefer a running coordination service so direct script invocations
+    # do not rewrite state out from under it; a stale socket left by a
+    # dead server falls back to direct access
+    status = None
+    if socket_path.exists():
+        try:
+            status = coordination_request(socket_path, 'get_status_report')
+        except OSError:
+            status = None
+    if status is None:
+        status = CoordinationSystem(base_path).get_status_report()
+
     print("Coordination System Status:")
-    status = coord.get_status_report()
     print(f"Active agents: {status['active_agents']}")
     print(f"Active locks: {status['active_locks']}")
     print(f"Coordination enabled: {status['coordination_enabled']}")
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Regression tests for the parallel agent coordination system"""
+
+import importlib.util
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+_MODULE_PATH = Path(__file__).resolve().with_name("coordination-system.py")
+_spec = importlib.util.spec_from_file_location("coordination_system", _MODULE_PATH)
+coordination_system = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(coordination_system)
+
+
+class _CoordinationDirTest(unittest.TestCase):
+    """Shared scaffolding: a temporary project directory with task files
+    and tracked CoordinationSystem instances flushed on teardown"""
+
+    use_sqlite = False
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base_path = self._tmp.name
+        self.tasks_dir = Path(self.base_path) / "meta" / "tasks"
+        self.tasks_dir.mkdir(parents=True)
+        self.task_a = self._write_task("task-a.md", "meta/fileA.py")
+        self.task_b = self._write_task("task-b.md", "meta/fileB.py")
+        self._systems = []
+
+    def tearDown(self):
+        for system in self._systems:
+            system.flush()
+        self._tmp.cleanup()
+
+    def _write_task(self, name: str, modifies: str) -> str:
+        task_path = self.tasks_dir / name
+        task_path.write_text(
+            f"# {name}\n"
+            "**Assigned Mode**: meta\n"
+            "**Estimated Duration**: 30 minutes\n"
+            f"**Modifies Files**: {modifies}\n"
+            "**Parallel Compatible**: true\n"
+        )
+        return str(task_path)
+
+    def _system(self):
+        system = coordination_system.CoordinationSystem(
+            self.base_path, use_sqlite=self.use_sqlite)
+        self._systems.append(system)
+        return system
+
+
+class ConcurrentInstanceTest(_CoordinationDirTest):
+    """Instances sharing one coordination directory must not lose each
+    other's journaled operations when either of them compacts the log"""
+
+    def test_flush_preserves_registrations_from_both_instances(self):
+        instance_a = self._system()
+        instance_b = self._system()
+
+        self.assertTrue(instance_a.register_agent("agentA", "meta", self.task_a))
+        self.assertTrue(instance_b.register_agent("agentB", "meta", self.task_b))
+        instance_a.flush()
+        instance_b.flush()
+
+        fresh = self._system()
+        self.assertIn("agentA", fresh._agents_data['agents'])
+        self.assertIn("agentB", fresh._agents_data['agents'])
+
+    def test_lock_held_by_other_instance_is_respected(self):
+        instance_a = self._system()
+        instance_b = self._system()
+
+        self.assertTrue(instance_a.acquire_file_lock("agentA", "meta/shared.py"))
+        self.assertFalse(instance_b.acquire_file_lock("agentB", "meta/shared.py"))
+
+
+class SqliteConcurrentInstanceTest(ConcurrentInstanceTest):
+    """The same cross-instance guarantees must hold with the opt-in
+    SQLite backend"""
+
+    use_sqlite = True
+
+
+class ExternalSnapshotEditTest(_CoordinationDirTest):
+    """Snapshots rewritten in place by the jq-based shell scripts must be
+    merged by a long-lived instance instead of overwritten"""
+
+    def test_agent_added_by_external_tool_survives_flush(self):
+        instance = self._system()
+        self.assertTrue(instance.register_agent("agentA", "meta", self.task_a))
+        instance.flush()
+
+        snapshot = instance.active_agents_file
+        data = json.loads(snapshot.read_text())
+        data['agents']['agentJq'] = dict(data['agents']['agentA'])
+        snapshot.write_text(json.dumps(data, indent=2))
+
+        self.assertTrue(instance.update_heartbeat("agentA"))
+        instance.flush()
+
+        persisted = json.loads(snapshot.read_text())
+        self.assertIn("agentJq", persisted['agents'])
+        self.assertIn("agentA", persisted['agents'])
+
+
+if __name__ == "__main__":
+    unittest.main()